@@ -5,9 +5,17 @@ import threading
 import sys
 import os
 import string
-from speech_engine import SpeechListener
 from datetime import datetime 
-from llm_helper import get_llm
+from concurrent.futures import ThreadPoolExecutor
+from llm_helper import get_llm, load_llm_config
+
+# --- Deferred Imports ---
+# speech_engine (audio stack) is slow to import, so it is only pulled in
+# when the listener is actually built. llm_helper defers requests itself.
+
+def create_listener():
+    from speech_engine import SpeechListener
+    return SpeechListener()
 
 # --- AppleScript Helper ---
 def run_applescript(script):
@@ -171,28 +179,103 @@ def ppt_goto(index):
 
 class FridayPresenter:
     def __init__(self):
-        self.listener = SpeechListener()
-        self.load_configs()
-        self.llm = get_llm() #new method to load llm
+        self.launch_time = time.time()
+        self.startup_times = {}
+
+        # The listener (mic open + calibration) is the slowest part; build it
+        # in the background while configs load and the overlays spawn.
+        self.startup_pool = ThreadPoolExecutor(max_workers=1)
+        self.listener_future = self.startup_pool.submit(self.timed, "listener", create_listener)
+        self.listener = None
+
+        self.timed("configs", self.load_configs)
+        self._llm = None # built on first use, see self.llm
         self.is_running = True
         self.auto_mode = False
         self.timer_process = None
+        self.timer_standby = False
         self.subtitle_process = None
  
         self.current_presentation_slides = [] 
         self.current_slide_ptr = 0 
         self.interrupt_event = threading.Event()
 
+        # Overlay interpreters import Tk / PyQt6 in their own process, so
+        # spawning them now lets those imports overlap with listener setup.
+        self.timed("overlays", self.prespawn_overlays)
+
+    def timed(self, name, fn):
+        start = time.time()
+        result = fn()
+        self.startup_times[name] = time.time() - start
+        return result
+
+    @property
+    def llm(self):
+        """The LLM client, built on first use. None if it isn't configured or failed to build."""
+        if self._llm is None and self.llm_config is not None:
+            try:
+                self._llm = get_llm(config=self.llm_config)
+            except Exception as e:
+                print(f"[!] LLM Error: {e}")
+            if self._llm is None:
+                self.llm_config = None # don't retry on every explain
+        return self._llm
+
+    def prespawn_overlays(self):
+        self.start_subtitle_overlay()
+        self.prespawn_timer_overlay()
+
+    def wait_until_ready(self):
+        """Blocks until the listener is built and prints the time-to-ready breakdown."""
+        if self.listener is None:
+            try:
+                self.listener = self.listener_future.result()
+            except BaseException:
+                # No mic / audio stack failure / Ctrl-C: don't orphan the pre-spawned overlays
+                self.stop_overlays()
+                raise
+            finally:
+                self.startup_pool.shutdown(wait=False)
+        self.startup_times["ready"] = time.time() - self.launch_time
+        breakdown = " | ".join(f"{name} {secs * 1000:.0f} ms" for name, secs in self.startup_times.items())
+        print(f"[*] Startup: {breakdown}")
+
     def load_configs(self):
         try:
             with open("commands.json", "r") as f: self.commands = json.load(f)
-            with open("slides_master.json", "r") as f: self.slides_master = json.load(f)
+            with open("slides_master.json", "r") as f: self.default_slides = json.load(f)
+            self.slides_master = self.default_slides
             with open("presentations.json", "r") as f: self.presentations = json.load(f)
             with open("tts_config.json", "r") as f: self.tts_config = json.load(f)
             print(f"Configs loaded. Voice: {self.tts_config.get('voice', 'Default')}")
         except FileNotFoundError as e:
             print(f"Error loading config: {e}")
             sys.exit(1)
+        self.check_llm_config()
+
+    def check_llm_config(self):
+        """Validates llm_config.json at launch, so a bad config fails here rather than mid-talk."""
+        try:
+            self.llm_config = load_llm_config()
+        except FileNotFoundError:
+            print("Warning: llm_config.json not found. 'Explain' is disabled.")
+            self.llm_config = None
+        except ValueError as e:
+            print(f"Error loading config: {e}")
+            sys.exit(1)
+
+    def load_deck(self, name):
+        """Switches slide data to the ingested deck store (see ppt_ingest.py), else back to slides_master.json."""
+        self.slides_master = self.default_slides
+        store = self.presentations.get(name, {}).get("slides")
+        if not store:
+            return
+        try:
+            with open(store, "r") as f: self.slides_master = json.load(f)
+            print(f"Deck loaded: {store} ({len(self.slides_master)} slides)")
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Error loading deck: {e}. Using slides_master.json")
 
     def speak_text(self, text):
         voice = self.tts_config.get("voice", "Zoe")
@@ -205,14 +288,47 @@ class FridayPresenter:
         text = text.translate(str.maketrans('', '', string.punctuation))
         return text.lower().strip()
 
-    def start_timer_overlay(self):
+    def prespawn_timer_overlay(self):
+        """Spawns the timer hidden; it waits on stdin for 'start'/'stop'."""
         if self.timer_process is None or self.timer_process.poll() is not None:
-            print("[*] Starting Timer Overlay...")
-            self.timer_process = subprocess.Popen([sys.executable, "timer_overlay.py"])
+            self.timer_process = subprocess.Popen(
+                [sys.executable, "timer_overlay.py", "--standby"],
+                stdin=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+            self.timer_standby = True
+
+    def send_timer_command(self, command):
+        try:
+            self.timer_process.stdin.write(command + "\n")
+            self.timer_process.stdin.flush()
+            return True
+        except BrokenPipeError:
+            return False
+
+    def start_timer_overlay(self):
+        print("[*] Starting Timer Overlay...")
+        if self.timer_process is not None and self.timer_process.poll() is None:
+            if not self.timer_standby or self.send_timer_command("start"):
+                return
+        # Standby process is gone (e.g. closed by double-click); start one directly
+        self.timer_process = subprocess.Popen([sys.executable, "timer_overlay.py"])
+        self.timer_standby = False
 
     def stop_timer_overlay(self):
         if self.timer_process and self.timer_process.poll() is None:
             print("[*] Stopping Timer Overlay...")
+            if self.timer_standby and self.send_timer_command("stop"):
+                return # hidden and ready for the next "start timer"
+            self.timer_process.terminate()
+            self.timer_process = None
+            # Get a standby timer back so the next "start timer" is instant again
+            self.prespawn_timer_overlay()
+
+    def stop_overlays(self):
+        self.stop_subtitle_overlay()
+        if self.timer_process and self.timer_process.poll() is None:
             self.timer_process.terminate()
             self.timer_process = None
 
@@ -282,7 +398,7 @@ class FridayPresenter:
             matches = len(text_words.intersection(keywords))
             if matches > 0 and matches > max_matches:
                 max_matches = matches
-                best_match = int(data['index'])
+                best_match = int(data.get('index', slide_id))
         return best_match
 
     def run_automation(self):
@@ -344,10 +460,8 @@ class FridayPresenter:
 
 
     def start(self):
+        self.wait_until_ready()
         print("Friday Presenter Ready. Listening...")
-        
-        # Start subtitles immediately when Friday starts
-        self.start_subtitle_overlay()
 
         while self.is_running:
             try:
@@ -379,7 +493,10 @@ class FridayPresenter:
                     
                     if query:
                         self.speak_text("Let me check that for you.")
-                        response = self.llm.generate_response(query, p_overview)
+                        if self.llm is None:
+                            response = "I'm sorry, my AI assistant isn't available right now."
+                        else:
+                            response = self.llm.generate_response(query, p_overview)
                         print(f"Friday AI Answer: {response}")
                         
                         # Display on subtitle
@@ -413,6 +530,7 @@ class FridayPresenter:
                     print(f"Opening presentation: {p_name}...")
                     self.current_presentation_slides = p_seq
                     self.current_slide_ptr = 0
+                    self.load_deck(p_name)
                     ppt_open(p_file)     
                     ppt_start()          
                     ppt_goto(p_seq[0])   
@@ -449,7 +567,7 @@ class FridayPresenter:
             except KeyboardInterrupt:
                 self.is_running = False
                 self.interrupt_event.set()
-                self.stop_subtitle_overlay() # Cleanup subtitles
+                self.stop_overlays() # Cleanup subtitles and timer
                 print("\nGoodbye.")
 
 if __name__ == "__main__":
@@ -1,9 +1,7 @@
 import json
-import requests
-import urllib3
 
-# Suppress "InsecureRequestWarning" for if using an internal gateway
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# requests/urllib3 are imported on first use so that reading the config at
+# startup stays cheap.
 
 class AzureOpenAILLM:
     def __init__(self, api_key, endpoint, deployment, api_version, system_prompt):
@@ -48,6 +46,11 @@ class AzureOpenAILLM:
         }
 
         try:
+            import requests
+            import urllib3
+            # Suppress "InsecureRequestWarning" for if using an internal gateway
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
             print(f"[*] Friday AI: Thinking about '{query}'...")
             
             # verify=False is critical for the internal gateway
@@ -67,14 +70,35 @@ class AzureOpenAILLM:
             print(f"[!] LLM Error: {e}")
             return "I'm sorry, I couldn't connect to the brain network right now."
 
+# --- Config ---
+def load_llm_config(config_path="llm_config.json"):
+    """
+    Reads and validates the LLM config. Raises FileNotFoundError if it is
+    missing and ValueError if it is malformed or names an unsupported LLM.
+    """
+    with open(config_path) as f:
+        config = json.load(f)
+
+    if config.get("llm") != "azure_openai":
+        raise ValueError(f"Unsupported LLM type: {config.get('llm')}")
+    try:
+        config["api_keys"]["azure_openai"]
+        for key in ("endpoint_base", "deployment", "api_version"):
+            config["azure_config"][key]
+        config["system_prompt"]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{config_path} is missing {e}")
+    return config
+
 # --- Factory Function ---
-def get_llm(config_path="llm_config.json"):
+def get_llm(config_path="llm_config.json", config=None):
     """
-    Reads config and returns the configured LLM instance.
+    Reads config (unless an already validated one is passed) and returns
+    the configured LLM instance.
     """
     try:
-        with open(config_path) as f:
-            config = json.load(f)
+        if config is None:
+            config = load_llm_config(config_path)
             
         if config["llm"] == "azure_openai":
             return AzureOpenAILLM(
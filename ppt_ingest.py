@@ -0,0 +1,402 @@
+import os
+import sys
+import json
+import time
+import string
+import zipfile
+import hashlib
+import argparse
+import tempfile
+import posixpath
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+# --- OOXML Namespaces ---
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+P_SP = f"{{{NS_P}}}sp"
+P_PH = f"{{{NS_P}}}ph"
+P_SLD = f"{{{NS_P}}}sld"
+P_SLD_ID = f"{{{NS_P}}}sldId"
+A_P = f"{{{NS_A}}}p"
+A_T = f"{{{NS_A}}}t"
+A_BR = f"{{{NS_A}}}br"
+R_ID = f"{{{NS_R}}}id"
+REL = f"{{{NS_REL}}}Relationship"
+
+NOTES_REL_TYPE = "/notesSlide"
+TITLE_TYPES = ("title", "ctrTitle")
+# Placeholders on a notes page that are not the presenter's notes
+NOTES_SKIP_TYPES = ("sldImg", "sldNum", "hdr", "ftr", "dt")
+
+DECKS_DIR = "decks"
+DEFAULT_DURATION = 2
+
+ORDINALS = [
+    "first", "second", "third", "fourth", "fifth", "sixth", "seventh",
+    "eighth", "ninth", "tenth", "eleventh", "twelfth", "thirteenth",
+    "fourteenth", "fifteenth", "sixteenth", "seventeenth", "eighteenth",
+    "nineteenth", "twentieth"
+]
+
+STOPWORDS = {
+    "the", "and", "for", "with", "from", "into", "onto", "about", "this",
+    "that", "these", "those", "your", "our", "their", "are", "was", "were",
+    "will", "can", "how", "what", "why", "who", "when", "where", "which",
+    "its", "you", "not", "but", "all", "any", "has", "have", "out", "over",
+    "slide", "friday"
+}
+
+
+# --- Hashing ---
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """Content hash of a deck, read in chunks so large files stay off the heap."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# --- Streaming XML Parsing ---
+
+def has_part(zf, part):
+    try:
+        zf.getinfo(part)
+        return True
+    except KeyError:
+        return False
+
+def read_relationships(zf, part):
+    """Returns {rId: (type, absolute part name)} for a part's internal relationships."""
+    folder, name = posixpath.split(part)
+    rels_part = posixpath.join(folder, "_rels", name + ".rels")
+    rels = {}
+    if not has_part(zf, rels_part):
+        return rels
+    with zf.open(rels_part) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == REL and elem.get("TargetMode") != "External":
+                target = elem.get("Target", "")
+                # Targets are relative to the part's folder, or to the package root if they start with '/'
+                if target.startswith("/"):
+                    target = posixpath.normpath(target.lstrip("/"))
+                else:
+                    target = posixpath.normpath(posixpath.join(folder, target))
+                rels[elem.get("Id")] = (elem.get("Type", ""), target)
+            elem.clear()
+    return rels
+
+def read_slide_order(zf):
+    """Returns the slide part names in presentation order."""
+    rels = read_relationships(zf, "ppt/presentation.xml")
+    order = []
+    with zf.open("ppt/presentation.xml") as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == P_SLD_ID:
+                rel = rels.get(elem.get(R_ID))
+                if rel:
+                    order.append(rel[1])
+                elem.clear()
+    return order
+
+def read_shapes(zf, part):
+    """
+    Stream-parses a slide (or notes) part and returns
+    (hidden, [(placeholder_type, [paragraph text, ...]), ...]).
+    Elements are cleared as soon as they are consumed so memory stays
+    flat regardless of slide size.
+    """
+    shapes = []
+    hidden = False
+    ph_type = None
+    paragraphs = []
+    runs = []
+    depth = 0
+
+    with zf.open(part) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == P_SLD:
+                    hidden = elem.get("show") == "0"
+                elif tag == P_SP:
+                    depth += 1
+                    if depth == 1:
+                        ph_type, paragraphs = None, []
+                continue
+
+            if tag == P_PH and depth:
+                # A placeholder without a type attribute is a body placeholder
+                ph_type = elem.get("type", "body")
+            elif tag == A_T and depth:
+                runs.append(elem.text or "")
+            elif tag == A_BR and depth:
+                # Soft line break: keep the words on either side apart
+                runs.append(" ")
+            elif tag == A_P:
+                text = " ".join("".join(runs).split())
+                if text and depth:
+                    paragraphs.append(text)
+                runs = []
+                elem.clear()
+            elif tag == P_SP:
+                depth -= 1
+                if depth == 0:
+                    shapes.append((ph_type, paragraphs))
+                    elem.clear()
+    return hidden, shapes
+
+def parse_slide(zf, part):
+    """Extracts title, body text and speaker notes from a single slide."""
+    hidden, shapes = read_shapes(zf, part)
+    title = ""
+    body = []
+    for ph_type, paragraphs in shapes:
+        if ph_type in TITLE_TYPES and not title:
+            title = " ".join(paragraphs)
+        else:
+            body.extend(paragraphs)
+
+    notes = []
+    for rel_type, target in read_relationships(zf, part).values():
+        if rel_type.endswith(NOTES_REL_TYPE) and has_part(zf, target):
+            _, note_shapes = read_shapes(zf, target)
+            for ph_type, paragraphs in note_shapes:
+                if ph_type not in NOTES_SKIP_TYPES:
+                    notes.extend(paragraphs)
+
+    return {"title": title, "body": body, "notes": notes, "hidden": hidden}
+
+
+# --- Slide Data Derivation ---
+
+def title_words(title):
+    """Meaningful words of a title, in order. Numbers are kept ("Q3", "2024")."""
+    clean = title.translate(str.maketrans('', '', string.punctuation)).lower()
+    words = []
+    for word in clean.split():
+        if (len(word) > 2 or word.isdigit()) and word not in STOPWORDS and word not in words:
+            words.append(word)
+    return words
+
+def derive_keywords(title, index, shared=()):
+    """
+    Keywords are the title words no other slide's title uses, plus the
+    slide's ordinal. Shared words ("overview", "agenda") would make every
+    such slide match and the jump always land on the first one.
+    """
+    keywords = [w for w in title_words(title) if w not in shared]
+    if index <= len(ORDINALS):
+        keywords.append(ORDINALS[index - 1])
+    return keywords
+
+def derive_spoken_text(slide):
+    """Speaker notes win; otherwise narrate the title and body."""
+    if slide["notes"]:
+        return " ".join(slide["notes"])
+    parts = [slide["title"]] + slide["body"]
+    return ". ".join(p.rstrip(".") for p in parts if p) + "." if any(parts) else ""
+
+def ingest_deck(path):
+    """
+    Parses one .pptx and returns (slides, sequence) where slides has the
+    same shape as slides_master.json and sequence lists the visible slides.
+    """
+    slides = {}
+    sequence = []
+    with zipfile.ZipFile(path) as zf:
+        for index, part in enumerate(read_slide_order(zf), start=1):
+            slide = parse_slide(zf, part)
+            slides[str(index)] = {
+                "title": slide["title"],
+                "keywords": [],
+                "spoken_text": derive_spoken_text(slide),
+                "duration": DEFAULT_DURATION
+            }
+            if not slide["hidden"]:
+                sequence.append(index)
+
+    # Keywords need every title first, to know which words are shared
+    seen, shared = set(), set()
+    for data in slides.values():
+        for word in title_words(data["title"]):
+            (shared if word in seen else seen).add(word)
+    for key, data in slides.items():
+        data["keywords"] = derive_keywords(data["title"], int(key), shared)
+    return slides, sequence
+
+def _ingest_worker(job):
+    """Process pool entry point. Errors are returned, not raised, so one bad deck doesn't sink the batch."""
+    name, path = job
+    try:
+        slides, sequence = ingest_deck(path)
+        return name, slides, sequence, None
+    except Exception as e:
+        return name, None, None, f"{type(e).__name__}: {e}"
+
+
+# --- Library Ingestion ---
+
+def deck_store_path(name, base_dir):
+    return os.path.join(base_dir, DECKS_DIR, f"{name}.json")
+
+def ingest_library(config_path="presentations.json", force=False, workers=None):
+    """
+    Ingests every deck referenced in presentations.json. Decks whose content
+    hash matches the last ingest (and whose store still exists) are skipped.
+    Returns the names of the decks that were (re)built.
+    """
+    with open(config_path, "r") as f:
+        presentations = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(config_path))
+    os.makedirs(os.path.join(base_dir, DECKS_DIR), exist_ok=True)
+
+    jobs = []
+    hashes = {}
+    for name, data in presentations.items():
+        # Relative deck paths are relative to the config, like the stores we write
+        path = data.get("file") and os.path.join(base_dir, data["file"])
+        if not path or not os.path.exists(path):
+            print(f"[!] Skipping '{name}': file not found at {path}")
+            continue
+        hashes[name] = file_hash(path)
+        store = deck_store_path(name, base_dir)
+        if not force and data.get("source_hash") == hashes[name] and os.path.exists(store):
+            print(f"[*] '{name}' unchanged, skipping.")
+            continue
+        jobs.append((name, path))
+
+    built = []
+    if jobs:
+        # A single deck isn't worth the cost of spawning a pool
+        if len(jobs) == 1 or workers == 1:
+            results = [_ingest_worker(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_ingest_worker, jobs))
+
+        for name, slides, sequence, error in results:
+            if error:
+                print(f"[!] Failed to ingest '{name}': {error}")
+                continue
+            store = deck_store_path(name, base_dir)
+            with open(store, "w") as f:
+                json.dump(slides, f, indent=4)
+            entry = presentations[name]
+            entry["sequence"] = sequence
+            entry["slides"] = os.path.relpath(store, base_dir)
+            entry["source_hash"] = hashes[name]
+            built.append(name)
+            print(f"[*] Ingested '{name}': {len(slides)} slides -> {entry['slides']}")
+
+    if built:
+        with open(config_path, "w") as f:
+            json.dump(presentations, f, indent=4)
+    return built
+
+
+# --- Benchmark ---
+
+def write_synthetic_deck(path, n_slides):
+    """Writes a minimal but structurally valid .pptx with titles, bullets and notes."""
+    p, a, r = NS_P, NS_A, NS_R
+    sld_ids = "".join(f'<p:sldId id="{255 + i}" r:id="rId{i}"/>' for i in range(1, n_slides + 1))
+    pres_rels = "".join(
+        f'<Relationship Id="rId{i}" Type="{NS_R}/slide" Target="slides/slide{i}.xml"/>'
+        for i in range(1, n_slides + 1)
+    )
+
+    def shape(ph, paragraphs):
+        ph_xml = f'<p:ph type="{ph}"/>' if ph else '<p:ph idx="1"/>'
+        # '\n' in a paragraph becomes a soft line break
+        paras = "".join(
+            "<a:p>" + "<a:br/>".join(f"<a:r><a:t>{line}</a:t></a:r>" for line in t.split("\n")) + "</a:p>"
+            for t in paragraphs
+        )
+        return (f"<p:sp><p:nvSpPr><p:cNvPr id=\"1\" name=\"s\"/><p:cNvSpPr/><p:nvPr>{ph_xml}</p:nvPr></p:nvSpPr>"
+                f"<p:txBody><a:bodyPr/>{paras}</p:txBody></p:sp>")
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("ppt/presentation.xml",
+                    f'<p:presentation xmlns:p="{p}" xmlns:r="{r}"><p:sldIdLst>{sld_ids}</p:sldIdLst></p:presentation>')
+        zf.writestr("ppt/_rels/presentation.xml.rels",
+                    f'<Relationships xmlns="{NS_REL}">{pres_rels}</Relationships>')
+        for i in range(1, n_slides + 1):
+            bullets = [f"Point {j} about topic {i} and its architecture" for j in range(1, 6)]
+            title = f"Topic {i}\nOverview"
+            zf.writestr(f"ppt/slides/slide{i}.xml",
+                        f'<p:sld xmlns:p="{p}" xmlns:a="{a}"><p:cSld><p:spTree>'
+                        f'{shape("title", [title])}{shape(None, bullets)}'
+                        f'</p:spTree></p:cSld></p:sld>')
+            # Odd slides use a relative notes target, even ones an absolute one
+            notes_target = f"../notesSlides/notesSlide{i}.xml" if i % 2 else f"/ppt/notesSlides/notesSlide{i}.xml"
+            zf.writestr(f"ppt/slides/_rels/slide{i}.xml.rels",
+                        f'<Relationships xmlns="{NS_REL}"><Relationship Id="rId1" '
+                        f'Type="{NS_R}/notesSlide" Target="{notes_target}"/>'
+                        f'<Relationship Id="rId2" Type="{NS_R}/hyperlink" '
+                        f'Target="https://example.com/{i}" TargetMode="External"/></Relationships>')
+            zf.writestr(f"ppt/notesSlides/notesSlide{i}.xml",
+                        f'<p:notes xmlns:p="{p}" xmlns:a="{a}"><p:cSld><p:spTree>'
+                        f'{shape("sldImg", [])}{shape("body", [f"Here we walk through topic {i}."])}'
+                        f'{shape("sldNum", [str(i)])}</p:spTree></p:cSld></p:notes>')
+
+def benchmark_ingest(n_slides=1000):
+    """Times ingest of a synthetic deck and returns the elapsed seconds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.pptx")
+        write_synthetic_deck(path, n_slides)
+        start = time.perf_counter()
+        slides, sequence = ingest_deck(path)
+        elapsed = time.perf_counter() - start
+    print(f"[*] Ingested {len(slides)} slides in {elapsed:.3f}s "
+          f"({elapsed / max(len(slides), 1) * 1000:.2f} ms/slide)")
+    check_synthetic(slides, n_slides)
+    return elapsed
+
+def check_synthetic(slides, n_slides):
+    """Sanity-checks what ingest made of the synthetic deck; raises ValueError on a mismatch."""
+    for i in range(1, min(n_slides, 2) + 1):
+        expected = {
+            "title": f"Topic {i} Overview",
+            "keywords": [str(i), ORDINALS[i - 1]] if n_slides > 1 else ["topic", "1", "overview", "first"],
+            "spoken_text": f"Here we walk through topic {i}.",
+        }
+        for field, value in expected.items():
+            if slides[str(i)][field] != value:
+                raise ValueError(f"slide {i} {field}: expected {value!r}, got {slides[str(i)][field]!r}")
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build Friday's deck store from .pptx files.")
+    parser.add_argument("--config", default="presentations.json")
+    parser.add_argument("--force", action="store_true", help="Re-ingest decks even if unchanged.")
+    parser.add_argument("--workers", type=positive_int, default=None, help="Process pool size (default: CPU count).")
+    parser.add_argument("--bench", type=int, metavar="SLIDES", help="Benchmark ingest of a synthetic deck.")
+    args = parser.parse_args()
+
+    if args.bench:
+        try:
+            benchmark_ingest(args.bench)
+        except ValueError as e:
+            print(f"[!] Synthetic deck check failed: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    try:
+        ingest_library(args.config, force=args.force, workers=args.workers)
+    except FileNotFoundError as e:
+        print(f"Error loading config: {e}")
+        sys.exit(1)
@@ -0,0 +1,521 @@
+"""
+Deterministic simulation harness for the Friday presenter loop.
+
+Runs the real FridayPresenter.start() loop against scripted sessions with
+fakes for the microphone, PowerPoint (AppleScript), `say`, imagesnap, the
+overlays and the LLM. All waiting happens on a virtual clock, so a session
+that takes minutes on stage replays in milliseconds on any OS.
+
+    python simulate.py                     # run all scenarios, compare to baselines
+    python simulate.py --scenario explain  # run one scenario
+    python simulate.py --update-baselines  # accept current numbers as the new baseline
+
+Exits non-zero if a scenario expectation fails or a metric regresses.
+"""
+import io
+import os
+import re
+import sys
+import json
+import time
+import heapq
+import types
+import argparse
+import tempfile
+import itertools
+import threading
+import contextlib
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCENARIOS_FILE = os.path.join(BASE_DIR, "sim_scenarios.json")
+BASELINES_FILE = os.path.join(BASE_DIR, "sim_baselines.json")
+# Frozen copies of the presenter's configs, so editing slide content or
+# re-ingesting decks doesn't move the baselines
+FIXTURES_DIR = os.path.join(BASE_DIR, "sim_fixtures")
+
+# Cost of spawning osascript / open, on top of any 'delay' inside the script
+OSASCRIPT_COST = 0.15
+OPEN_COST = 0.5
+IMAGESNAP_COST = 0.5
+LLM_LATENCY = 1.5
+# Startup costs: building the listener (mic open + calibration), building the
+# LLM client (importing requests) and forking an overlay interpreter.
+# Scenarios can override the listener cost with "listener_startup".
+LISTENER_STARTUP = 0.8
+LLM_STARTUP = 0.3
+OVERLAY_SPAWN_COST = 0.05
+FUTURE_POLL = 0.01
+
+# System Events key codes for digits (mirrors ppt_goto)
+DIGIT_KEY_CODES = {
+    29: '0', 18: '1', 19: '2', 20: '3', 21: '4',
+    23: '5', 22: '6', 26: '7', 28: '8', 25: '9'
+}
+
+DEFAULT_TOLERANCE = 0.05
+
+
+# --- Virtual Clock ---
+
+class SimulationTimeout(Exception):
+    pass
+
+class VirtualClock:
+    """
+    Lockstep virtual clock. Exactly one simulated thread runs at a time;
+    when it sleeps, the clock jumps to the earliest pending wake-up and
+    hands control to that thread. Ties go to whoever slept first, so every
+    run interleaves identically.
+    """
+    def __init__(self, limit=3600):
+        self.now = 0.0
+        self.limit = limit
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._seq = itertools.count()
+        self._running = 1  # the thread driving the simulation
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        wake = self.now + max(seconds, 0)
+        if wake > self.limit:
+            raise SimulationTimeout(f"Virtual clock passed {self.limit}s")
+        self._wait_until(wake)
+
+    def wait_idle(self):
+        """Blocks the caller until every other simulated thread has finished."""
+        self._wait_until(float("inf"))
+
+    def spawn(self, target):
+        """Starts a simulated thread. It first runs when the spawner blocks."""
+        token = [False]
+        with self._cond:
+            heapq.heappush(self._waiters, (self.now, next(self._seq), token))
+
+        def run():
+            with self._cond:
+                while not token[0]:
+                    self._cond.wait()
+            try:
+                target()
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._advance()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def _wait_until(self, wake):
+        token = [False]
+        with self._cond:
+            heapq.heappush(self._waiters, (wake, next(self._seq), token))
+            self._running -= 1
+            self._advance()
+            while not token[0]:
+                self._cond.wait()
+
+    def _advance(self):
+        if self._running == 0 and self._waiters:
+            wake, _, token = heapq.heappop(self._waiters)
+            if wake != float("inf"):
+                self.now = max(self.now, wake)
+            token[0] = True
+            self._running += 1
+            self._cond.notify_all()
+
+
+# --- Fakes ---
+
+class FakeResult:
+    def __init__(self, stdout=b""):
+        self.stdout = stdout
+        self.returncode = 0
+
+class FakeStdin:
+    def __init__(self, sink):
+        self.sink = sink
+
+    def write(self, text):
+        self.sink.append(text.rstrip("\n"))
+
+    def flush(self):
+        pass
+
+class FakeProcess:
+    """A child process that 'runs' until a virtual deadline (None = forever)."""
+    def __init__(self, clock, duration=None, stdin_sink=None):
+        self.clock = clock
+        self.end = None if duration is None else clock.now + duration
+        self.returncode = None
+        self.stdin = FakeStdin(stdin_sink) if stdin_sink is not None else None
+
+    def poll(self):
+        if self.returncode is None and self.end is not None and self.clock.now >= self.end:
+            self.returncode = 0
+        return self.returncode
+
+    def terminate(self):
+        if self.poll() is None:
+            self.end = self.clock.now
+            self.returncode = -15
+
+class FakeSubprocess:
+    """Stands in for the subprocess module: `say`, `open`, imagesnap and the overlays."""
+    PIPE = subprocess.PIPE
+    CalledProcessError = subprocess.CalledProcessError
+
+    def __init__(self, sim):
+        self.sim = sim
+
+    def Popen(self, args, **kwargs):
+        if args[0] == "say":
+            return self.sim.speak(args[-1])
+        # Overlay interpreters: alive until terminated, stdin lines kept per script
+        name = next(os.path.basename(a) for a in args if a.endswith(".py"))
+        self.sim.clock.sleep(OVERLAY_SPAWN_COST)
+        self.sim.record("spawn", name)
+        sink = self.sim.pipes.setdefault(name, []) if kwargs.get("stdin") == subprocess.PIPE else None
+        return FakeProcess(self.sim.clock, stdin_sink=sink)
+
+    def run(self, args, **kwargs):
+        if args[0] == "open":
+            self.sim.clock.sleep(OPEN_COST)
+        elif args[0] == "imagesnap":
+            warmup = float(args[args.index("-w") + 1]) if "-w" in args else 0
+            self.sim.clock.sleep(warmup + IMAGESNAP_COST)
+            self.sim.record("photo", args[-1])
+        return FakeResult()
+
+class FakePowerPoint:
+    """Interprets the AppleScript friday_presenter sends and tracks the slide show."""
+    def __init__(self, sim):
+        self.sim = sim
+        self.showing = False
+        self.slide = 0
+
+    def run_applescript(self, script):
+        for delay in re.findall(r"delay ([\d.]+)", script):
+            self.sim.clock.sleep(float(delay))
+        self.sim.clock.sleep(OSASCRIPT_COST)
+
+        if 'return "true"' in script:
+            return FakeResult(b"true" if self.showing else b"false")
+        if "go to next slide" in script:
+            if self.showing:
+                self.move(self.slide + 1, "next")
+        elif "go to previous slide" in script:
+            if self.showing:
+                self.move(max(self.slide - 1, 1), "previous")
+        elif "exit slide show" in script:
+            self.showing = False
+            self.sim.record("stop")
+        elif "run slide show" in script or "key code 36 using {command down, shift down}" in script:
+            self.showing = True
+            self.move(1, "start")
+        elif "key code 36" in script and "System Events" in script:
+            codes = [int(c) for c in re.findall(r"key code (\d+)", script)]
+            digits = "".join(DIGIT_KEY_CODES[c] for c in codes if c in DIGIT_KEY_CODES)
+            if self.showing and digits:
+                self.move(int(digits), "goto")
+        return FakeResult()
+
+    def move(self, slide, how):
+        self.slide = slide
+        self.sim.record(how, slide)
+
+class SimFuture:
+    """Runs a function on its own simulated thread; result() waits on the virtual clock."""
+    def __init__(self, clock, fn, args, kwargs):
+        self.clock = clock
+        self.done = False
+        self.value = None
+        self.error = None
+        clock.spawn(lambda: self._run(fn, args, kwargs))
+
+    def _run(self, fn, args, kwargs):
+        try:
+            self.value = fn(*args, **kwargs)
+        except BaseException as e:
+            self.error = e
+        self.done = True
+
+    def result(self):
+        while not self.done:
+            self.clock.sleep(FUTURE_POLL)
+        if self.error:
+            raise self.error
+        return self.value
+
+class SimExecutor:
+    """Stands in for ThreadPoolExecutor so background startup work runs on the virtual clock."""
+    def __init__(self, clock):
+        self.clock = clock
+
+    def submit(self, fn, *args, **kwargs):
+        return SimFuture(self.clock, fn, args, kwargs)
+
+    def shutdown(self, wait=True):
+        pass
+
+class FakeLLM:
+    def __init__(self, clock, latency=LLM_LATENCY):
+        self.clock = clock
+        self.latency = latency
+
+    def generate_response(self, query, context=""):
+        self.clock.sleep(self.latency)
+        return f"Here is a short simulated answer about {query}."
+
+class ScriptedListener:
+    """
+    Replays a scenario's steps in place of the microphone. Each step fires at
+    virtual time `at` (or immediately, if Friday was busy past it). The time
+    from handing over an utterance until the loop asks for the next one is
+    that command's latency.
+    """
+    def __init__(self, sim, steps):
+        self.sim = sim
+        self.steps = list(steps)
+        self.pending = None
+
+    def listen_once(self):
+        clock = self.sim.clock
+        if self.pending:
+            label, delivered = self.pending
+            self.sim.latencies.append((label, clock.now - delivered))
+            self.pending = None
+
+        while self.steps:
+            step = self.steps.pop(0)
+            clock.sleep(step.get("at", clock.now) - clock.now)
+            if "expect_slide" in step:
+                self.sim.check_slide(step["expect_slide"])
+            if "say" in step:
+                self.pending = (step.get("label", step["say"]), clock.now)
+                return step["say"]
+
+        self.sim.presenter.is_running = False
+        return None
+
+
+# --- Simulation ---
+
+def load_presenter_module():
+    """Imports friday_presenter from this directory; its heavy imports are deferred, so this needs no audio stack or requests."""
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    import friday_presenter
+    return friday_presenter
+
+@contextlib.contextmanager
+def patched(obj, **attrs):
+    saved = {name: getattr(obj, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(obj, name, value)
+
+class Simulation:
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.clock = VirtualClock(limit=scenario.get("max_seconds", 3600))
+        self.events = []
+        self.latencies = []
+        self.pipes = {}
+        self.spoken = []
+        self.failures = []
+        self.background = set()
+        self.automation = []  # (start, end) of each take_over run
+        self.powerpoint = FakePowerPoint(self)
+        self.presenter = None
+
+    # --- hooks used by the fakes ---
+    def record(self, kind, detail=None):
+        in_background = threading.current_thread() in self.background
+        self.events.append((self.clock.now, kind, detail, in_background))
+
+    def speak(self, text):
+        rate = float(self.presenter.tts_config.get("rate", 180))
+        self.spoken.append(text)
+        return FakeProcess(self.clock, duration=len(text.split()) / rate * 60)
+
+    def build(self, component, cost):
+        """Charges a component's construction cost to the virtual clock."""
+        self.clock.sleep(cost)
+        return component
+
+    def check_slide(self, expected):
+        if self.powerpoint.slide != expected:
+            self.failures.append(
+                f"t={self.clock.now:.2f}s expected slide {expected}, on slide {self.powerpoint.slide}")
+
+    def start_thread(self, target):
+        def run():
+            start = self.clock.now
+            try:
+                target()
+            finally:
+                self.automation.append((start, self.clock.now))
+        self.background.add(self.clock.spawn(run))
+
+    def run(self, module):
+        sim = self
+        listener = ScriptedListener(self, self.scenario["steps"])
+
+        class SimThread:
+            def __init__(self, target=None, **kwargs):
+                self.target = target
+
+            def start(self):
+                sim.start_thread(self.target)
+
+        fake_threading = types.SimpleNamespace(Thread=SimThread, Event=threading.Event)
+        fake_time = types.SimpleNamespace(time=self.clock.time, sleep=self.clock.sleep)
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                patched(module,
+                        create_listener=lambda: self.build(listener, self.scenario.get("listener_startup", LISTENER_STARTUP)),
+                        get_llm=lambda *a, **k: self.build(FakeLLM(self.clock), LLM_STARTUP),
+                        ThreadPoolExecutor=lambda *a, **k: SimExecutor(self.clock),
+                        run_applescript=self.powerpoint.run_applescript,
+                        subprocess=FakeSubprocess(self),
+                        threading=fake_threading,
+                        time=fake_time):
+            cwd = os.getcwd()
+            os.chdir(FIXTURES_DIR)
+            try:
+                self.presenter = module.FridayPresenter()
+
+                # ppt_open only needs the deck to exist on disk
+                for name, data in self.presenter.presentations.items():
+                    path = os.path.join(tmp, os.path.basename(data["file"]))
+                    open(path, "wb").close()
+                    data["file"] = path
+
+                wall_start = time.perf_counter()
+                self.presenter.start()
+                self.clock.wait_idle()
+                self.wall_seconds = time.perf_counter() - wall_start
+            finally:
+                os.chdir(cwd)
+
+        if "final_slide" in self.scenario:
+            self.check_slide(self.scenario["final_slide"])
+        return self.metrics()
+
+    def metrics(self):
+        """Flat {name: value} metrics. Names ending in _per_minute are higher-is-better."""
+        metrics = {
+            "session_seconds": self.clock.now,
+            "ready_seconds": self.presenter.startup_times["ready"],
+        }
+        seen = {}
+        for label, latency in self.latencies:
+            seen[label] = seen.get(label, 0) + 1
+            key = label if seen[label] == 1 else f"{label} #{seen[label]}"
+            metrics[f"latency[{key}]"] = latency
+
+        # Each slide runs from its goto until the next goto (or the end of that take_over run)
+        per_slide = []
+        for start, end in self.automation:
+            gotos = [t for t, kind, _, bg in self.events if bg and kind == "goto" and start <= t <= end]
+            per_slide += [b - a for a, b in zip(gotos, gotos[1:] + [end])]
+        if per_slide:
+            busy = sum(end - start for start, end in self.automation)
+            metrics["autopilot_slide_mean_seconds"] = sum(per_slide) / len(per_slide)
+            metrics["autopilot_slide_max_seconds"] = max(per_slide)
+            metrics["autopilot_slides_per_minute"] = len(per_slide) / busy * 60
+        return {k: round(v, 3) for k, v in metrics.items()}
+
+
+# --- Baselines ---
+
+def compare(name, metrics, baseline, tolerance):
+    """Returns regression messages for one scenario."""
+    regressions = []
+    for key, expected in baseline.items():
+        if key not in metrics:
+            regressions.append(f"{name}: metric '{key}' missing")
+            continue
+        actual = metrics[key]
+        slack = abs(expected) * tolerance + 0.01
+        if key.endswith("_per_minute"):
+            worse = actual < expected - slack
+        else:
+            worse = actual > expected + slack
+        if worse:
+            regressions.append(f"{name}: {key} regressed {expected} -> {actual}")
+    return regressions
+
+def run_scenarios(names=None, verbose=False):
+    with open(SCENARIOS_FILE, "r") as f:
+        scenarios = json.load(f)
+    module = load_presenter_module()
+
+    results = {}
+    for name, scenario in scenarios.items():
+        if names and name not in names:
+            continue
+        sim = Simulation(scenario)
+        out = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with out:
+            metrics = sim.run(module)
+        results[name] = (sim, metrics)
+    return results
+
+def report(name, sim, metrics):
+    print(f"\n== {name} ({sim.wall_seconds * 1000:.0f} ms wall, {metrics['session_seconds']:.1f}s virtual)")
+    for key, value in metrics.items():
+        print(f"   {key:<48} {value:>9.3f}")
+    for failure in sim.failures:
+        print(f"   [!] {failure}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay scripted sessions against the presenter loop.")
+    parser.add_argument("--scenario", action="append", help="Run only this scenario (repeatable).")
+    parser.add_argument("--update-baselines", action="store_true", help="Write current metrics as the baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative regression.")
+    parser.add_argument("--verbose", action="store_true", help="Show the presenter's own output.")
+    args = parser.parse_args()
+
+    results = run_scenarios(args.scenario, args.verbose)
+
+    try:
+        with open(BASELINES_FILE, "r") as f:
+            baselines = json.load(f)
+    except FileNotFoundError:
+        baselines = {}
+
+    problems = []
+    for name, (sim, metrics) in results.items():
+        report(name, sim, metrics)
+        problems += [f"{name}: {failure}" for failure in sim.failures]
+        if not args.update_baselines:
+            if name in baselines:
+                problems += compare(name, metrics, baselines[name], args.tolerance)
+            else:
+                print(f"   [!] No baseline for '{name}' (run with --update-baselines)")
+
+    if args.update_baselines:
+        for name, (_, metrics) in results.items():
+            baselines[name] = metrics
+        with open(BASELINES_FILE, "w") as f:
+            json.dump(baselines, f, indent=4)
+            f.write("\n")
+        print(f"\n[*] Baselines written to {BASELINES_FILE}")
+
+    if problems:
+        print("\nFAILED:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("\nAll scenarios passed.")
@@ -60,6 +60,8 @@ class SubtitleOverlay:
             if text:
                 # Schedule GUI update on main thread
                 self.root.after(0, self.update_text, text)
+        # Friday went away; close instead of lingering on screen
+        self.root.after(0, self.root.destroy)
 
 if __name__ == "__main__":
     SubtitleOverlay()
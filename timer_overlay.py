@@ -1,12 +1,25 @@
 import sys
 import json
+import threading
 from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal
 from PyQt6.QtGui import QFont
 
+class StdinCommands(QObject):
+    """Reads 'start'/'stop' lines from Friday. Signals hop the lines onto the GUI thread."""
+    command = pyqtSignal(str)
+
+    def listen(self):
+        for line in sys.stdin:
+            if line.strip():
+                self.command.emit(line.strip())
+        # Friday went away; don't linger as an invisible process
+        self.command.emit("quit")
+
 class PresentationTimer(QWidget):
-    def __init__(self):
+    def __init__(self, standby=False):
         super().__init__()
+        self.standby = standby
         self.load_settings()
         
         # 1. Window Setup
@@ -45,9 +58,31 @@ class PresentationTimer(QWidget):
         # 4. Timer Loop
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_timer)
-        self.timer.start(1000)
         self.update_display()
 
+    def start_countdown(self):
+        """Starts the countdown from the configured total and shows the window. A no-op while already counting."""
+        if self.timer.isActive():
+            return
+        self.time_left = self.settings.get("total_minutes", 1) * 60
+        style = self.label.styleSheet()
+        self.label.setStyleSheet(style.replace("color: #FFD700;", "color: white;").replace("color: #FF4500;", "color: white;"))
+        self.update_display()
+        self.show()
+        self.timer.start(1000)
+
+    def stop_countdown(self):
+        self.timer.stop()
+        self.hide()
+
+    def handle_command(self, command):
+        if command == "start":
+            self.start_countdown()
+        elif command == "stop":
+            self.stop_countdown()
+        elif command == "quit":
+            QApplication.quit()
+
     def load_settings(self):
         try:
             with open("timer_config.json", "r") as f:
@@ -89,10 +124,23 @@ class PresentationTimer(QWidget):
             self.old_pos = event.globalPosition().toPoint()
 
     def mouseDoubleClickEvent(self, event):
-        QApplication.quit()
+        # In standby Friday keeps us around for the next "start timer"
+        if self.standby:
+            self.stop_countdown()
+        else:
+            QApplication.quit()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    timer = PresentationTimer()
-    timer.show()
+    # --standby: Friday pre-spawns us hidden so "start timer" only has to write a line
+    standby = "--standby" in sys.argv
+    timer = PresentationTimer(standby=standby)
+
+    if standby:
+        app.setQuitOnLastWindowClosed(False)
+        commands = StdinCommands()
+        commands.command.connect(timer.handle_command)
+        threading.Thread(target=commands.listen, daemon=True).start()
+    else:
+        timer.start_countdown()
     sys.exit(app.exec())